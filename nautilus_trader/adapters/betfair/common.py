@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from enum import Enum
+from functools import lru_cache
 
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.model.enums import OrderSide
@@ -118,7 +119,11 @@ BETFAIR_TICK_SCHEME = TieredTickScheme(
 register_tick_scheme(BETFAIR_TICK_SCHEME)
 
 
+@lru_cache(maxsize=1024)
 def price_to_probability(price_str: str) -> Price:
+    # Betfair prices come from a fixed tick ladder, so the distinct inputs on
+    # the stream parsing hot path are bounded and the conversion (float parse,
+    # format, Price construction, map lookup) is safe to memoize
     PyCondition.type(price_str, str, "price", "str")
     price = Price.from_str(f"{float(price_str):.2f}")
     assert price > 0.0
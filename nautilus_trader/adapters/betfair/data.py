@@ -14,10 +14,11 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
-from typing import Optional
+import time
+from collections import deque
+from typing import Callable, Optional, Union
 
 import msgspec
-from betfair_parser.spec.streaming import STREAM_DECODER
 from betfair_parser.spec.streaming.mcm import MCM
 from betfair_parser.spec.streaming.status import Connection
 from betfair_parser.spec.streaming.status import Status
@@ -49,6 +50,21 @@ from nautilus_trader.model.instruments.betting import BettingInstrument
 from nautilus_trader.msgbus.bus import MessageBus
 
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+_HEARTBEAT_BYTES: bytes = msgspec.json.encode({"op": "heartbeat"})
+
+_INBOX_MAXSIZE: int = 4096
+_INBOX_WARN_DEPTH: int = (_INBOX_MAXSIZE * 3) // 4
+_DRAIN_YIELD_INTERVAL_SECS: float = 0.001
+
+# Data types emitted wrapped in GenericData rather than handled directly
+_GENERIC_DATA_TYPES: tuple[type, ...] = (BetfairStartingPrice, BSPOrderBookDeltas)
+
+
 class BetfairDataClient(LiveMarketDataClient):
     """
     Provides a data client for the Betfair API.
@@ -75,6 +91,31 @@ class BetfairDataClient(LiveMarketDataClient):
         If strict handling mode is enabled.
     """
 
+    __slots__ = (
+        "_instrument_provider",
+        "_client",
+        "_stream",
+        "parser",
+        "_decoder",
+        "_pending_subscribe",
+        "_inbox",
+        "_inbox_event",
+        "_inbox_dropped",
+        "_inbox_drop_logged",
+        "_inbox_pressure_logged",
+        "_drain_inbox_task",
+        "subscription_status",
+        "_subscribed_instrument_ids",
+        "_subscribed_instrument_ids_view",
+        "_strict_handling",
+        "_subscribed_market_ids",
+        "_subscribed_market_ids_tuple",
+        "_dispatch",
+        "_datatype_cache",
+        "_instrument_lookup_cache",
+        "_json_encoder",
+    )
+
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
@@ -104,15 +145,61 @@ class BetfairDataClient(LiveMarketDataClient):
         self._stream = BetfairMarketStreamClient(
             client=self._client,
             logger=logger,
-            message_handler=self.on_market_update,
+            message_handler=self._enqueue_market_update,
         )
         self.parser = BetfairParser()
+        self._decoder = msgspec.json.Decoder(Union[MCM, Connection, Status])
+        self._pending_subscribe = False
+
+        # Inbound stream buffering - frames are appended by the socket handler
+        # and drained in batches by a single consumer task. The inbox is
+        # bounded so a slow consumer sheds the oldest frames rather than
+        # letting the buffer grow until the event loop stalls
+        self._inbox: deque = deque(maxlen=_INBOX_MAXSIZE)
+        self._inbox_event = asyncio.Event()
+        self._inbox_dropped: int = 0
+        self._inbox_drop_logged = False
+        self._inbox_pressure_logged = False
+        self._drain_inbox_task: Optional[asyncio.Task] = None
         self.subscription_status = SubscriptionStatus.UNSUBSCRIBED
 
         # Subscriptions
         self._subscribed_instrument_ids: set[InstrumentId] = set()
+        # Immutable snapshot read by the hot update loop, refreshed on mutation
+        self._subscribed_instrument_ids_view: frozenset = frozenset()
         self._strict_handling = strict_handling
         self._subscribed_market_ids: set[InstrumentId] = set()
+        # Sorted snapshot rebuilt on mutation - gives deterministic ordering
+        # for subscription messages without a copy per send
+        self._subscribed_market_ids_tuple: tuple = ()
+
+        # Hot-path dispatch - exact type lookup avoids the isinstance chain
+        # in the per-update loop (isinstance remains as the fallback for
+        # subclasses and the generic Data / Event cases)
+        self._dispatch: dict[type, Callable] = {
+            data_cls: self._make_generic_data for data_cls in _GENERIC_DATA_TYPES
+        }
+
+        # DataType is immutable and safe to share, so cache per (type, instrument)
+        # rather than allocating a new one for every update
+        self._datatype_cache: dict[tuple[type, InstrumentId], DataType] = {}
+
+        # Memoized provider lookups, invalidated whenever the provider reloads
+        self._instrument_lookup_cache: dict[InstrumentId, BettingInstrument] = {}
+
+        # Shared encoder for downstream sinks; amortizes buffer allocation
+        # across calls and returns bytes directly
+        self._json_encoder = msgspec.json.Encoder()
+
+        # The kernel installs the uvloop policy where supported, but a client
+        # can be constructed with any loop; high-rate market streams are
+        # noticeably slower on the pure-Python selector loop
+        if uvloop is not None and not isinstance(loop, uvloop.Loop):
+            self._log.warning(
+                "Market stream running on a non-uvloop event loop: install the "
+                "uvloop event loop policy before constructing the client for "
+                "best streaming performance",
+            )
 
     @property
     def instrument_provider(self) -> BetfairInstrumentProvider:
@@ -125,14 +212,15 @@ class BetfairDataClient(LiveMarketDataClient):
 
         # Connect market data socket
         await self._stream.connect()
+        self._drain_inbox_task = self._loop.create_task(self._drain_inbox())
 
         # Pass any preloaded instruments into the engine
         if self._instrument_provider.count == 0:
             await self._instrument_provider.load_all_async()
+            self._instrument_lookup_cache.clear()
         instruments = self._instrument_provider.list_all()
         self._log.debug(f"Loading {len(instruments)} instruments from provider into cache, ")
-        for instrument in instruments:
-            self._handle_data(instrument)
+        self._handle_data_batch(instruments)
 
         self._log.debug(
             f"DataEngine has {len(self._cache.instruments(BETFAIR_VENUE))} Betfair instruments",
@@ -145,9 +233,14 @@ class BetfairDataClient(LiveMarketDataClient):
     async def _post_connect_heartbeat(self):
         for _ in range(3):
             await asyncio.sleep(5)
-            await self._stream.send(msgspec.json.encode({"op": "heartbeat"}))
+            await self._stream.send(_HEARTBEAT_BYTES)
 
     async def _disconnect(self):
+        # Cancel inbox consumer
+        if self._drain_inbox_task is not None:
+            self._drain_inbox_task.cancel()
+            self._drain_inbox_task = None
+
         # Close socket
         self._log.info("Closing streaming socket...")
         await self._stream.disconnect()
@@ -162,6 +255,7 @@ class BetfairDataClient(LiveMarketDataClient):
             return
 
         self._subscribed_instrument_ids = set()
+        self._subscribed_instrument_ids_view = frozenset()
 
     def _dispose(self):
         if self.is_connected:
@@ -179,6 +273,7 @@ class BetfairDataClient(LiveMarketDataClient):
 
     async def _handle_instrument_search(self, data_type: DataType, correlation_id: UUID4):
         await self._instrument_provider.load_all_async(market_filter=data_type.metadata)
+        self._instrument_lookup_cache.clear()
         instruments = self._instrument_provider.search_instruments(
             instrument_filter=data_type.metadata,
         )
@@ -203,7 +298,11 @@ class BetfairDataClient(LiveMarketDataClient):
             kwargs = {}
         PyCondition.not_none(instrument_id, "instrument_id")
 
-        instrument: BettingInstrument = self._instrument_provider.find(instrument_id)
+        instrument: BettingInstrument = self._instrument_lookup_cache.get(instrument_id)
+        if instrument is None:
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is not None:
+                self._instrument_lookup_cache[instrument_id] = instrument
 
         if instrument.market_id in self._subscribed_market_ids:
             self._log.warning(
@@ -216,14 +315,21 @@ class BetfairDataClient(LiveMarketDataClient):
         # subscription after a short delay to allow other strategies to send
         # their subscriptions (every change triggers a full snapshot).
         self._subscribed_market_ids.add(instrument.market_id)
+        self._subscribed_market_ids_tuple = tuple(sorted(self._subscribed_market_ids))
         self._subscribed_instrument_ids.add(instrument.id)
+        self._subscribed_instrument_ids_view = frozenset(self._subscribed_instrument_ids)
         if self.subscription_status == SubscriptionStatus.UNSUBSCRIBED:
+            self._pending_subscribe = True
             self._loop.create_task(self.delayed_subscribe(delay=5))
             self.subscription_status = SubscriptionStatus.PENDING_STARTUP
         elif self.subscription_status == SubscriptionStatus.PENDING_STARTUP:
             pass
         elif self.subscription_status == SubscriptionStatus.RUNNING:
-            self._loop.create_task(self.delayed_subscribe(delay=0))
+            # Coalesce bursts of subscribe calls into a single message - only
+            # schedule a resubscribe if one isn't already pending
+            if not self._pending_subscribe:
+                self._pending_subscribe = True
+                self._loop.create_task(self.delayed_subscribe(delay=0.1))
 
         self._log.info(
             f"Added market_id {instrument.market_id} for {instrument_id.symbol} <OrderBook> data.",
@@ -232,16 +338,23 @@ class BetfairDataClient(LiveMarketDataClient):
     async def delayed_subscribe(self, delay=0):
         self._log.debug(f"Scheduling subscribe for delay={delay}")
         await asyncio.sleep(delay)
-        self._log.info(f"Sending subscribe for market_ids {self._subscribed_market_ids}")
-        await self._stream.send_subscription_message(market_ids=list(self._subscribed_market_ids))
-        self._log.info(f"Added market_ids {self._subscribed_market_ids} for <OrderBookData> data.")
+        # Snapshot after the debounce window so any market ids added while
+        # waiting are included in this single subscription message
+        self._pending_subscribe = False
+        market_ids = self._subscribed_market_ids_tuple
+        self._log.info(f"Sending subscribe for market_ids {market_ids}")
+        await self._stream.send_subscription_message(market_ids=market_ids)
+        self._log.info(f"Added market_ids {market_ids} for <OrderBookData> data.")
 
     async def _subscribe_ticker(self, instrument_id: InstrumentId) -> None:
         pass  # Subscribed as part of orderbook
 
     async def _subscribe_instrument(self, instrument_id: InstrumentId):
-        for instrument in self._instrument_provider.list_all():
-            self._handle_data(data=instrument)
+        instrument = self._instrument_provider.find(instrument_id)
+        if instrument is None:
+            self._log.warning(f"Instrument not found in provider: {instrument_id}")
+            return
+        self._handle_data(data=instrument)
 
     async def _subscribe_instrument_status_updates(self, instrument_id: InstrumentId):
         pass  # Subscribed as part of orderbook
@@ -265,9 +378,79 @@ class BetfairDataClient(LiveMarketDataClient):
     def handle_data(self, data: Data):
         self._handle_data(data=data)
 
+    def encode(self, obj) -> bytes:
+        """
+        Encode the given object to JSON bytes using the clients shared encoder.
+
+        Parameters
+        ----------
+        obj : object
+            The object to encode.
+
+        Returns
+        -------
+        bytes
+
+        """
+        return self._json_encoder.encode(obj)
+
     # -- STREAMS ----------------------------------------------------------------------------------
+    def _enqueue_market_update(self, raw: bytes):
+        inbox = self._inbox
+        depth = len(inbox)
+        if depth == _INBOX_MAXSIZE:
+            self._inbox_dropped += 1
+            # Latch the warning and the degrade call - at peak stream rate
+            # logging per dropped frame only worsens the backpressure
+            if not self._inbox_drop_logged:
+                self._inbox_drop_logged = True
+                self._log.warning(
+                    f"Market update inbox full ({_INBOX_MAXSIZE}), dropping oldest frames "
+                    f"(total dropped: {self._inbox_dropped})",
+                )
+            if not self.is_degraded:
+                self.degrade()
+        elif depth >= _INBOX_WARN_DEPTH and not self._inbox_pressure_logged:
+            self._inbox_pressure_logged = True
+            self._log.warning(
+                f"Market update inbox depth {depth} of {_INBOX_MAXSIZE} - consumer falling behind",
+            )
+        inbox.append(raw)
+        self._inbox_event.set()
+
+    async def _drain_inbox(self):
+        # Drain all buffered frames per wakeup so parse and dispatch costs are
+        # amortized across a batch rather than paid once per socket callback
+        inbox = self._inbox
+        event = self._inbox_event
+        while True:
+            await event.wait()
+            event.clear()
+            deadline = time.monotonic() + _DRAIN_YIELD_INTERVAL_SECS
+            while inbox:
+                raw = inbox.popleft()
+                try:
+                    self.on_market_update(raw)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # A single bad frame must not kill the consumer task
+                    self._log.exception(f"Error handling market update, raw: {raw!r}", e)
+                if time.monotonic() >= deadline:
+                    # Draining a deep backlog must not starve the shared live
+                    # loop - yield and continue where we left off
+                    await asyncio.sleep(0)
+                    deadline = time.monotonic() + _DRAIN_YIELD_INTERVAL_SECS
+            self._inbox_drop_logged = False
+            self._inbox_pressure_logged = False
+
     def on_market_update(self, raw: bytes):
-        update = STREAM_DECODER.decode(raw)
+        try:
+            update = self._decoder.decode(raw)
+        except msgspec.DecodeError as e:
+            # An unrecognized frame must not tear down the stream consumer - drop it
+            self._log.error(f"Failed to decode stream message: {e}, raw: {raw!r}")
+            return
         if isinstance(update, MCM):
             self._on_market_update(mcm=update)
         elif isinstance(update, Connection):
@@ -275,36 +458,57 @@ class BetfairDataClient(LiveMarketDataClient):
         elif isinstance(update, Status):
             self._handle_status_message(update=update)
         else:
-            raise RuntimeError
+            # An unknown message must not tear down the stream consumer - drop it
+            self._log.error(f"Unknown message type: {type(update).__name__}, {update}")
+
+    def _make_generic_data(self, data) -> GenericData:
+        # Not a regular data type
+        key = (type(data), data.instrument_id)
+        data_type = self._datatype_cache.get(key)
+        if data_type is None:
+            data_type = DataType(type(data), metadata={"instrument_id": data.instrument_id})
+            self._datatype_cache[key] = data_type
+        return GenericData(data_type, data)
 
     def _on_market_update(self, mcm: MCM):
         self._check_stream_unhealthy(update=mcm)
         updates = self.parser.parse(mcm=mcm)
+        dispatch = self._dispatch
+        strict_handling = self._strict_handling
+        subscribed_instrument_ids = self._subscribed_instrument_ids_view
+        # The logger doesn't expose its level, so bypass mode is the only
+        # cheap way to skip building the debug string per update
+        debug = None if self._log.is_bypassed else self._log.debug
+        to_emit: list[Data] = []
+        append = to_emit.append
         for data in updates:
-            self._log.debug(f"{data}")
-            if isinstance(data, (BetfairStartingPrice, BSPOrderBookDeltas)):
-                # Not a regular data type
-                generic_data = GenericData(
-                    DataType(data.__class__, metadata={"instrument_id": data.instrument_id}),
-                    data,
-                )
-                self._handle_data(generic_data)
+            if debug is not None:
+                debug(f"{data}")
+            wrapper = dispatch.get(type(data))
+            if wrapper is not None:
+                append(wrapper(data))
+            elif isinstance(data, _GENERIC_DATA_TYPES):
+                # Subclass of a table entry - route through the same path
+                append(self._make_generic_data(data))
             elif isinstance(data, Data):
-                if self._strict_handling:
+                if strict_handling:
                     if (
                         hasattr(data, "instrument_id")
-                        and data.instrument_id not in self._subscribed_instrument_ids
+                        and data.instrument_id not in subscribed_instrument_ids
                     ):
                         # We receive data for multiple instruments within a subscription, don't emit data if we're not
                         # subscribed to this particular instrument as this will trigger a bunch of error logs
                         continue
-                self._handle_data(data)
+                append(data)
             elif isinstance(data, Event):
                 self._log.warning(
                     f"Received event: {data}, DataEngine not yet setup to send events",
                 )
             else:
-                raise RuntimeError()
+                # An unknown update must not tear down the stream consumer - drop it
+                self._log.error(f"Unknown data type: {type(data).__name__}, {data}")
+        if to_emit:
+            self._handle_data_batch(to_emit)
 
     def _check_stream_unhealthy(self, update: MCM):
         if update.stream_unreliable:
@@ -449,8 +449,13 @@ def runner_change_to_order_book_deltas(
     ts_init,
 ) -> Optional[OrderBookDeltas]:
     deltas = []
+    append = deltas.append
     for side in B_SIDE_KINDS:
-        for upd in getattr(runner, side, []):
+        side_updates = getattr(runner, side, None)
+        if not side_updates:
+            continue
+        order_side = B2N_MARKET_STREAM_SIDE[side]
+        for upd in side_updates:
             # TODO(bm): Clean this up
             if len(upd) == 3:
                 _, price, volume = upd
@@ -458,7 +463,7 @@ def runner_change_to_order_book_deltas(
                 price, volume = upd
             if price == 0.0:
                 continue
-            deltas.append(
+            append(
                 OrderBookDelta(
                     instrument_id=instrument_id,
                     book_type=BookType.L2_MBP,
@@ -466,7 +471,7 @@ def runner_change_to_order_book_deltas(
                     order=BookOrder(
                         price=price_to_probability(str(price)),
                         size=Quantity(volume, precision=BETFAIR_QUANTITY_PRECISION),
-                        side=B2N_MARKET_STREAM_SIDE[side],
+                        side=order_side,
                     ),
                     ts_event=ts_event,
                     ts_init=ts_init,
@@ -31,6 +31,9 @@ CRLF = b"\r\n"
 ENCODING = "utf-8"
 _UNIQUE_ID = 0
 
+# Shared encoder amortizes buffer allocation across sends
+_ENCODER: msgspec.json.Encoder = msgspec.json.Encoder()
+
 
 class BetfairStreamClient(SocketClient):
     """
@@ -114,8 +117,8 @@ class BetfairOrderStreamClient(BetfairStreamClient):
             "initialClk": None,
             "clk": None,
         }
-        await self.send(msgspec.json.encode(self.auth_message()))
-        await self.send(msgspec.json.encode(subscribe_msg))
+        await self.send(_ENCODER.encode(self.auth_message()))
+        await self.send(_ENCODER.encode(subscribe_msg))
 
 
 class BetfairMarketStreamClient(BetfairStreamClient):
@@ -209,7 +212,7 @@ class BetfairMarketStreamClient(BetfairStreamClient):
             "heartbeatMs": heartbeat_ms,
             "segmentationEnabled": segmentation_enabled,
         }
-        await self.send(msgspec.json.encode(message))
+        await self.send(_ENCODER.encode(message))
 
     async def post_connection(self):
-        await self.send(msgspec.json.encode(self.auth_message()))
+        await self.send(_ENCODER.encode(self.auth_message()))
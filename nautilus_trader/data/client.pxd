@@ -56,6 +56,7 @@ cdef class DataClient(Component):
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
     cpdef void _handle_data(self, Data data) except *
+    cpdef void _handle_data_batch(self, list batch) except *
     cpdef void _handle_data_response(self, DataType data_type, data, UUID4 correlation_id) except *
 
 
@@ -181,6 +181,9 @@ cdef class DataClient(Component):
     def _handle_data_py(self, Data data):
         self._handle_data(data)
 
+    def _handle_data_batch_py(self, list batch):
+        self._handle_data_batch(batch)
+
     def _handle_data_response_py(self, DataType data_type, data, UUID4 correlation_id):
         self._handle_data_response(data_type, data, correlation_id)
 
@@ -189,6 +192,11 @@ cdef class DataClient(Component):
     cpdef void _handle_data(self, Data data) except *:
         self._msgbus.send(endpoint="DataEngine.process", msg=data)
 
+    cpdef void _handle_data_batch(self, list batch) except *:
+        cdef Data data
+        for data in batch:
+            self._msgbus.send(endpoint="DataEngine.process", msg=data)
+
     cpdef void _handle_data_response(self, DataType data_type, data, UUID4 correlation_id) except *:
         cdef DataResponse response = DataResponse(
             client_id=self.id,
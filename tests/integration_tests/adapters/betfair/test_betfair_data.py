@@ -23,15 +23,18 @@ import pytest
 from betfair_parser.spec.streaming import STREAM_DECODER
 
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
+from nautilus_trader.adapters.betfair.data import _INBOX_MAXSIZE
 from nautilus_trader.adapters.betfair.data import BetfairDataClient
 from nautilus_trader.adapters.betfair.data import BetfairParser
 from nautilus_trader.adapters.betfair.data import InstrumentSearch
 from nautilus_trader.adapters.betfair.data_types import BetfairStartingPrice
 from nautilus_trader.adapters.betfair.data_types import BetfairTicker
 from nautilus_trader.adapters.betfair.data_types import BSPOrderBookDeltas
+from nautilus_trader.adapters.betfair.data_types import SubscriptionStatus
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.adapters.betfair.providers import make_instruments
 from nautilus_trader.adapters.betfair.providers import parse_market_catalog
+from nautilus_trader.adapters.betfair.sockets import BetfairMarketStreamClient
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.enums import LogLevel
@@ -218,9 +221,54 @@ class TestBetfairDataClient:
         self.client.subscribe_instrument_status_updates(self.instrument_id)
         self.client.subscribe_instrument_close(self.instrument_id)
 
+    @pytest.mark.asyncio
+    async def test_subscribe_order_book_deltas_coalesces_bursts(self):
+        # Arrange
+        self.client.subscription_status = SubscriptionStatus.RUNNING
+        instruments = self.instruments[:3]
+
+        with patch.object(BetfairMarketStreamClient, "send_subscription_message") as mock_send:
+            # Act
+            for instrument in instruments:
+                self.client.subscribe_order_book_deltas(instrument.id, BookType.L2_MBP)
+            await asyncio.sleep(0.3)
+
+        # Assert
+        assert mock_send.call_count == 1
+        market_ids = mock_send.call_args.kwargs["market_ids"]
+        assert market_ids == tuple(sorted({ins.market_id for ins in instruments}))
+
+    @pytest.mark.asyncio
+    async def test_subscribe_instrument_emits_only_requested_instrument(self):
+        # Act
+        await self.client._subscribe_instrument(self.instrument.id)
+
+        # Assert
+        assert self.messages == [self.instrument]
+
     def test_market_heartbeat(self):
         self.client.on_market_update(BetfairStreaming.mcm_HEARTBEAT())
 
+    def test_inbox_overflow_drops_oldest_and_degrades_once(self):
+        # Arrange
+        logs = []
+        self.logger.register_sink(logs.append)
+        self.client.start()
+        raw = BetfairStreaming.mcm_HEARTBEAT()
+
+        # Act
+        for _ in range(_INBOX_MAXSIZE + 10):
+            self.client._enqueue_market_update(raw)
+
+        # Assert
+        assert len(self.client._inbox) == _INBOX_MAXSIZE
+        assert self.client._inbox_dropped == 10
+        assert self.client.is_degraded
+        drop_warnings = [
+            log for log in logs if log["level"] == "WRN" and "inbox full" in log["msg"]
+        ]
+        assert len(drop_warnings) == 1
+
     def test_stream_latency(self):
         logs = []
         self.logger.register_sink(logs.append)
@@ -146,6 +146,33 @@ class TestDataClient:
         # Assert
         assert self.data_engine.data_count == 1
 
+    def test_handle_data_batch_sends_each_item_to_data_engine_in_order(self):
+        # Arrange
+        endpoint = []
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.data_engine.process)
+        self.msgbus.register(endpoint="DataEngine.process", handler=endpoint.append)
+
+        data_type = DataType(NewsEvent, {"Type": "NEWS_WIRE"})
+        batch = [
+            GenericData(
+                data_type,
+                NewsEvent(
+                    impact=NewsImpact.HIGH,
+                    name="Unemployment Rate",
+                    currency=USD,
+                    ts_event=i,
+                    ts_init=i,
+                ),
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        self.client._handle_data_batch_py(batch)
+
+        # Assert
+        assert endpoint == batch
+
     def test_handle_data_response_sends_to_data_engine(self):
         # Arrange
         data_type = DataType(NewsEvent, {"Type": "NEWS_WIRE"})